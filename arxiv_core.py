@@ -6,14 +6,21 @@ ArXiv API 核心模块
 """
 
 import arxiv
+import asyncio
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+import heapq
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterable, List, Any, Tuple, Optional
 from collections import defaultdict
 import math
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 import hashlib
 
@@ -28,6 +35,17 @@ except ImportError:
     RAPIDFUZZ_AVAILABLE = False
     print("⚠️  rapidfuzz 不可用，使用 difflib 作为备用方案")
 
+# 进程级共享的HTTP会话：连接池复用同一主机的 TCP+TLS 连接，
+# 并发下载多篇 PDF 时不再每次重新握手；瞬时错误走指数退避重试
+_HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_HTTP_SESSION.mount("https://", _http_adapter)
+_HTTP_SESSION.mount("http://", _http_adapter)
+
 
 class ArxivAPI:
     """ArXiv API 交互类 - 使用官方arxiv库"""
@@ -198,6 +216,18 @@ class ArxivAPI:
             start_dt=start_dt, end_dt=end_dt, categories=categories, max_results=max_results, batch_config=batch_config
         )
 
+    async def aget_recent_papers(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """get_recent_papers 的协程版本，便于多个查询并发 gather
+
+        arxiv 官方库是同步实现，这里通过线程转发让事件循环在等待
+        网络往返时可以调度其他查询。
+        """
+        return await asyncio.to_thread(self.get_recent_papers, *args, **kwargs)
+
+    async def aget_papers_by_date_range(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """get_papers_by_date_range 的协程版本，便于多个查询并发 gather"""
+        return await asyncio.to_thread(self.get_papers_by_date_range, *args, **kwargs)
+
     def _batch_search_papers(
         self,
         start_dt: datetime,
@@ -311,8 +341,21 @@ class ArxivAPI:
             if not result:
                 return False, "无法找到论文"
 
-            # 下载PDF
-            result.download_pdf(dirpath=str(self.download_dir), filename=pdf_filename)
+            # 下载PDF：流式拉取并按 1 MiB 大块写盘，减少小块 write 的系统调用；
+            # posix_fadvise 提示内核顺序访问，写完后释放页缓存（PDF 不会被马上重读）
+            response = _HTTP_SESSION.get(result.pdf_url, timeout=self.timeout, stream=True)
+            response.raise_for_status()
+
+            with open(pdf_path, "wb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+                if hasattr(os, "posix_fadvise"):
+                    f.flush()
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
             # 创建元数据文件
             if create_metadata:
@@ -327,40 +370,44 @@ class ArxivAPI:
             return False, error_msg
 
     def batch_download_pdfs(
-        self, papers: List[Dict[str, Any]], max_downloads: int = 10, create_index: bool = True
+        self, papers: Iterable[Dict[str, Any]], max_downloads: int = 10, create_index: bool = True
     ) -> Dict[str, Any]:
         """
         批量下载PDF
 
         Args:
-            papers: 论文列表
+            papers: 论文序列（任意可迭代对象，最多消费 max_downloads 篇）
             max_downloads: 最大下载数量
             create_index: 是否创建索引文件
 
         Returns:
             下载统计信息
         """
-        stats = {"total": len(papers), "downloaded": 0, "skipped": 0, "failed": 0, "failed_papers": []}
-
-        download_count = 0
+        # islice 只消费前 max_downloads 篇，调用方无需先切片复制前缀
+        to_download = list(islice(papers, max_downloads))
+        stats = {"total": len(to_download), "downloaded": 0, "skipped": 0, "failed": 0, "failed_papers": []}
         downloaded_papers = []
 
-        for paper in papers:
-            if download_count >= max_downloads:
-                break
+        if not to_download:
+            return stats
 
-            success, result = self.download_pdf(paper)
-            if success:
-                stats["downloaded"] += 1
-                downloaded_papers.append({**paper, "pdf_path": result})
-            else:
-                if "已存在" in result:
-                    stats["skipped"] += 1
-                else:
-                    stats["failed"] += 1
-                    stats["failed_papers"].append({"title": paper.get("title", ""), "error": result})
+        # 下载是纯网络 I/O，串行时每篇都要空等一次往返；
+        # 线程池并发提交，把多篇论文的网络等待时间重叠起来
+        with ThreadPoolExecutor(max_workers=min(4, len(to_download))) as executor:
+            futures = {executor.submit(self.download_pdf, paper): paper for paper in to_download}
 
-            download_count += 1
+            for future in as_completed(futures):
+                paper = futures[future]
+                success, result = future.result()
+                if success:
+                    stats["downloaded"] += 1
+                    downloaded_papers.append({**paper, "pdf_path": result})
+                else:
+                    if "已存在" in result:
+                        stats["skipped"] += 1
+                    else:
+                        stats["failed"] += 1
+                        stats["failed_papers"].append({"title": paper.get("title", ""), "error": result})
 
         # 创建下载索引
         if create_index and downloaded_papers:
@@ -416,13 +463,17 @@ class ArxivAPI:
     def _parse_arxiv_result(self, result: arxiv.Result) -> Optional[Dict[str, Any]]:
         """解析arxiv.Result对象为论文信息字典"""
         try:
+            authors = [author.name for author in result.authors]
+            published = result.published
             return {
                 "title": result.title.strip(),
-                "authors": [author.name for author in result.authors],
-                "authors_str": ", ".join([author.name for author in result.authors]),
+                "authors": authors,
+                "authors_str": ", ".join(authors),
                 "summary": result.summary.strip(),
-                "published_date": result.published,
-                "updated_date": result.updated if result.updated else result.published,
+                "published_date": published,
+                # 展示/保存会多次用到同一格式的发布时间，解析时渲染一次
+                "published_str": published.strftime("%Y-%m-%d %H:%M") if published else "",
+                "updated_date": result.updated if result.updated else published,
                 "paper_url": result.entry_id,
                 "pdf_url": result.pdf_url,
                 "categories": [cat for cat in result.categories],
@@ -628,6 +679,19 @@ class ArxivAPI:
             print(f"创建索引文件失败: {e}")
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> Optional["re.Pattern"]:
+    """把关键词列表预编译为单个交替正则（按长度降序，优先匹配长词）
+
+    对论文文本做一次线性扫描即可判断是否有任何关键词命中，
+    替代逐关键词的 O(N*L) 子串扫描；按关键词元组缓存编译结果。
+    """
+    if not keywords:
+        return None
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered), re.IGNORECASE)
+
+
 class PaperRanker:
     """论文智能排序和过滤类"""
 
@@ -1082,6 +1146,7 @@ class PaperRanker:
         score_weights: Dict[str, float] = None,
         raw_interest_keywords: List[str] = None,
         required_keywords_config: Dict[str, Any] = None,
+        top_k: Optional[int] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
         """
         根据关注词条过滤和排序论文 (支持高级评分和必须关键词)
@@ -1094,6 +1159,8 @@ class PaperRanker:
             use_advanced_scoring: 是否使用高级智能评分
             score_weights: 评分权重配置
             required_keywords_config: 必须包含关键词配置
+            top_k: 只需要前 k 篇时传入，用堆选择代替整体排序；
+                   默认 None 返回完整排序列表（报告和同步需要全量）
 
         Returns:
             tuple: (ranked_papers, excluded_papers, score_stats)
@@ -1171,17 +1238,21 @@ class PaperRanker:
                 if final_score >= min_score:
                     scored_papers.append(paper)
 
-        # 按相关性分数降序排序
+        # 按相关性分数降序排序；只要前 k 篇时堆选择是 O(N log k)，
+        # 远小于整体排序的 O(N log N)
         sort_key = "final_score" if use_advanced_scoring else "relevance_score"
-        ranked_papers = sorted(scored_papers, key=lambda x: x.get(sort_key, 0), reverse=True)
+        if top_k is not None and top_k < len(scored_papers):
+            ranked_papers = heapq.nlargest(top_k, scored_papers, key=lambda x: x.get(sort_key, 0))
+        else:
+            ranked_papers = sorted(scored_papers, key=lambda x: x.get(sort_key, 0), reverse=True)
 
-        # 统计信息
-        scores = [p.get(sort_key, 0) for p in ranked_papers]
+        # 统计信息（基于全部入选论文，不受 top_k 截断影响）
+        scores = [p.get(sort_key, 0) for p in scored_papers]
         required_filtered = len([p for p in excluded_papers if p.get("exclude_reason") == "未包含必须关键词"])
 
         score_stats = {
             "total_papers": len(papers),
-            "ranked_papers": len(ranked_papers),
+            "ranked_papers": len(scored_papers),
             "excluded_papers": len(excluded_papers),
             "required_filtered": required_filtered,
             "max_score": max(scores) if scores else 0,
@@ -1383,6 +1454,12 @@ class PaperRanker:
 
     def _detect_cooccurrence(self, keywords: List[str], text: str) -> float:
         """检测关键词共现，提升相关性"""
+        # 预编译的交替正则先做一次线性扫描；完全无命中（常见情况）时
+        # 直接返回，跳过逐关键词的子串扫描
+        pattern = _compile_keyword_pattern(tuple(keywords))
+        if pattern is None or pattern.search(text) is None:
+            return 1.0
+
         text_lower = text.lower()
         found_keywords = []
 
@@ -6,16 +6,38 @@
 
 import sys
 import os
-import glob
+import json
+import logging
+import yaml
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import hydra
+from dotenv import load_dotenv
 from hydra.core.hydra_config import HydraConfig
 from omegaconf import DictConfig, OmegaConf
 from pathlib import Path
 from typing import List, Dict, Any
 
-# 添加项目路径
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# 项目路径常量，避免热路径上重复的 abspath/dirname/join 计算
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_CONF_DIR = os.path.join(_MODULE_DIR, "conf")
+
+# 模块日志器：%s 延迟格式化，级别被关掉时连字符串拼接都不会发生；
+# 自带纯消息格式的 handler 并关闭向上传播，避免被 Hydra 的根日志格式改写
+log = logging.getLogger("arxiv_hydra")
+if not log.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_log_handler)
+    log.propagate = False
+log.setLevel(logging.INFO)
+
+# 优先使用 libyaml 加速的C解析器，不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from arxiv_core import ArxivAPI, PaperRanker
 from paper_display import PaperDisplayer
@@ -23,6 +45,7 @@ from paper_display import PaperDisplayer
 # 飞书集成导入
 try:
     from feishu_bitable_connector import FeishuBitableConnector
+    from feishu_chat_notification import create_chat_notifier_from_config
     from sync_to_feishu import sync_papers_to_feishu
 
     FEISHU_AVAILABLE = True
@@ -31,13 +54,95 @@ except ImportError:
     print("⚠️ 飞书模块未找到，将跳过飞书同步功能")
 
 
+# 扩展配置结构的基础默认值：模块级构建一次并冻结，
+# 避免每个配置都重新走一遍大字典字面量的 OmegaConf 包装
+_BASE_CFG = OmegaConf.create(
+    {
+        "search": {"days": 7, "max_results": 300, "max_display": 10, "min_score": 0.1, "field": "all"},
+        "download": {
+            "enabled": False,
+            "max_downloads": 10,
+            "download_dir": "downloads",
+            "create_metadata": True,
+            "create_index": True,
+            "force_download": False,
+        },
+        "intelligent_matching": {
+            "enabled": False,
+            "score_weights": {"base": 1.0, "semantic": 0.3, "author": 0.2, "novelty": 0.4, "citation": 0.3},
+            "fuzzy_threshold": 0.8,
+            "time_decay_days": 30,
+        },
+        "display": {"show_ranking": True, "show_scores": True, "show_breakdown": False, "stats": True},
+        "output": {"save": True, "save_keywords": False, "include_scores": True, "format": "markdown"},
+    }
+)
+OmegaConf.set_readonly(_BASE_CFG, True)
+
+
+def _load_config_dict(config_path: str):
+    """读取配置文件为字典，优先使用JSON侧车缓存
+
+    JSON解析（C实现）比YAML快一个数量级。首次解析YAML成功后在
+    conf/.cache/ 下原子地写入同名JSON；之后只要JSON比YAML新就直接读JSON。
+    """
+    cache_dir = os.path.join(os.path.dirname(config_path), ".cache")
+    config_base = os.path.basename(config_path)
+    cache_path = os.path.join(cache_dir, os.path.splitext(config_base)[0] + ".json")
+
+    # JSON缓存比YAML新时直接使用
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(config_path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # 缓存不存在或损坏，回退到YAML解析
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        cfg_dict = yaml.load(f, Loader=_YamlLoader)
+
+    # 原子写入JSON缓存（不可序列化或目录只读时静默跳过）
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cfg_dict, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return cfg_dict
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(config_path: str, mtime_ns: int, size: int) -> DictConfig:
+    """解析YAML配置并按 (路径, mtime, 大小) 缓存，避免重复解析同一文件
+
+    mtime_ns/size 仅作为缓存键使用：文件被修改后缓存自动失效。
+    返回的配置对象是只读的，需要修改时请通过 load_config_file 获取副本。
+    """
+    cfg = OmegaConf.create(_load_config_dict(config_path))
+    OmegaConf.set_readonly(cfg, True)
+    return cfg
+
+
+def load_config_file(config_path: str) -> DictConfig:
+    """加载YAML配置文件（带缓存），返回可修改的副本"""
+    stat = os.stat(config_path)
+    cached = _load_yaml_cached(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    return OmegaConf.create(OmegaConf.to_container(cached))
+
+
 def find_sync_configs() -> List[str]:
     """查找所有以sync开头的配置文件"""
-    conf_dir = os.path.join(os.path.dirname(__file__), "conf")
-    pattern = os.path.join(conf_dir, "sync*.yaml")
-
-    sync_configs = glob.glob(pattern)
-    config_names = [os.path.basename(config).replace(".yaml", "") for config in sync_configs]
+    # os.scandir 单次遍历即可完成过滤，省去 glob 的模式编译和逐项 stat
+    with os.scandir(_CONF_DIR) as entries:
+        config_names = [
+            entry.name[: -len(".yaml")]
+            for entry in entries
+            if entry.is_file() and entry.name.startswith("sync") and entry.name.endswith(".yaml")
+        ]
+    config_names.sort()
 
     print(f"🔍 发现 {len(config_names)} 个同步配置文件:")
     for config_name in config_names:
@@ -52,8 +157,8 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
         print(f"\n🚀 开始处理配置: {config_name}")
         print("=" * 60)
 
-        # 加载配置文件
-        config_path = os.path.join("conf", f"{config_name}.yaml")
+        # 加载配置文件（绝对路径，不依赖当前工作目录）
+        config_path = f"{_CONF_DIR}/{config_name}.yaml"
         if not os.path.exists(config_path):
             return {
                 "config_name": config_name,
@@ -66,29 +171,23 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
                 "ranked_papers": [],
             }
 
-        # 直接加载YAML配置文件
-        import yaml
+        # 直接加载YAML配置文件（带缓存，批量模式下同一文件只解析一次）
+        cfg = load_config_file(config_path)
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            cfg_dict = yaml.safe_load(f)
-
-        cfg = OmegaConf.create(cfg_dict)
+        # 一次性快照为普通dict：后续的结构探测和取值都走C级dict访问，
+        # 避免每次 hasattr/get 触发OmegaConf的解析和校验机制
+        cfg_d = OmegaConf.to_container(cfg, resolve=True)
 
         # 检查是否是扩展配置结构
-        if hasattr(cfg, "search_config") or hasattr(cfg, "user_profile"):
-            # 创建基础配置结构
-            base_cfg = OmegaConf.create(
-                {
-                    "search": {"days": 7, "max_results": 300, "max_display": 10, "min_score": 0.1, "field": "all"},
-                    "download": {"enabled": False, "max_downloads": 10, "download_dir": "downloads"},
-                    "intelligent_matching": {"enabled": False, "score_weights": {"base": 1.0, "semantic": 0.3}},
-                    "display": {"show_ranking": True, "show_scores": True, "show_breakdown": False, "stats": True},
-                    "output": {"save": True, "save_keywords": False, "include_scores": True, "format": "markdown"},
-                }
-            )
-            final_cfg = merge_configs(base_cfg, cfg)
+        if "search_config" in cfg_d or "user_profile" in cfg_d:
+            final_cfg = OmegaConf.to_container(merge_configs(_BASE_CFG, cfg), resolve=True)
         else:
-            final_cfg = cfg
+            final_cfg = cfg_d
+
+        # 用户信息只提取一次，后续各返回分支直接复用
+        user_profile = final_cfg.get("user_profile", {}) or {}
+        research_area = user_profile.get("research_area", config_name.replace("sync_", ""))
+        table_name = user_profile.get("name", "").replace("研究员", "").strip() + "论文表"
 
         # 初始化组件
         download_dir = final_cfg.get("download", {}).get("download_dir", "downloads")
@@ -120,10 +219,8 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
                     "error": "日期范围搜索需要指定开始日期",
                     "new_papers": 0,
                     "total_papers": 0,
-                    "research_area": final_cfg.get("user_profile", {}).get(
-                        "research_area", config_name.replace("sync_", "")
-                    ),
-                    "table_name": final_cfg.get("user_profile", {}).get("name", "").replace("研究员", "") + "论文表",
+                    "research_area": research_area,
+                    "table_name": table_name,
                     "ranked_papers": [],
                 }
 
@@ -150,10 +247,8 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
                 "success": True,
                 "new_papers": 0,
                 "total_papers": 0,
-                "research_area": final_cfg.get("user_profile", {}).get(
-                    "research_area", config_name.replace("sync_", "")
-                ),
-                "table_name": final_cfg.get("user_profile", {}).get("name", "").replace("研究员", "") + "论文表",
+                "research_area": research_area,
+                "table_name": table_name,
                 "ranked_papers": [],
             }
 
@@ -178,8 +273,10 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
 
             # 同步到飞书多维表格
             if ranked_papers and FEISHU_AVAILABLE:
-                # 设置环境变量避免个别通知
-                os.environ["BATCH_MODE"] = "1"
+                # 设置环境变量避免个别通知（并发批量模式下由 process_all_configs 统一设置）
+                batch_mode_preset = os.environ.get("BATCH_MODE") == "1"
+                if not batch_mode_preset:
+                    os.environ["BATCH_MODE"] = "1"
                 try:
                     # 直接使用现有的同步函数
                     sync_result = sync_papers_to_feishu(ranked_papers, final_cfg)
@@ -199,18 +296,16 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
                     synced_count = 0
                 finally:
                     # 恢复环境变量
-                    os.environ.pop("BATCH_MODE", None)
+                    if not batch_mode_preset:
+                        os.environ.pop("BATCH_MODE", None)
 
             return {
                 "config_name": config_name,
                 "success": True,
                 "new_papers": max(synced_count, 0),
                 "total_papers": len(ranked_papers),
-                "research_area": final_cfg.get("user_profile", {}).get(
-                    "research_area", config_name.replace("sync_", "")
-                ),
-                "table_name": final_cfg.get("user_profile", {}).get("name", "").replace("研究员", "").strip()
-                + "论文表",
+                "research_area": research_area,
+                "table_name": table_name,
                 "ranked_papers": ranked_papers[:1] if ranked_papers else [],  # 只返回最佳论文作为推荐
             }
 
@@ -219,8 +314,8 @@ def process_single_config(config_name: str) -> Dict[str, Any]:
             "success": True,
             "new_papers": 0,
             "total_papers": len(papers),
-            "research_area": final_cfg.get("user_profile", {}).get("research_area", config_name.replace("sync_", "")),
-            "table_name": final_cfg.get("user_profile", {}).get("name", "").replace("研究员", "").strip() + "论文表",
+            "research_area": research_area,
+            "table_name": table_name,
             "ranked_papers": [],
         }
 
@@ -252,21 +347,28 @@ def process_all_configs() -> bool:
 
         print(f"\n🎯 开始处理 {len(sync_configs)} 个配置...")
 
-        # 处理每个配置
+        # 各配置相互独立（网络I/O为主），用线程池并发处理
+        # 全局设置批量模式，避免各线程在同步时竞争切换环境变量
+        os.environ["BATCH_MODE"] = "1"
         all_results = []
-        total_new_papers = 0
-        successful_configs = 0
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(sync_configs))) as executor:
+                future_map = {executor.submit(process_single_config, name): name for name in sync_configs}
+                for future in as_completed(future_map):
+                    result = future.result()
+                    all_results.append(result)
+
+                    config_name = future_map[future]
+                    if result["success"]:
+                        print(f"✅ {config_name}: 新增 {result['new_papers']} 篇论文")
+                    else:
+                        print(f"❌ {config_name}: 失败 - {result.get('error', '未知错误')}")
+        finally:
+            os.environ.pop("BATCH_MODE", None)
 
-        for config_name in sync_configs:
-            result = process_single_config(config_name)
-            all_results.append(result)
-
-            if result["success"]:
-                successful_configs += 1
-                total_new_papers += result["new_papers"]
-                print(f"✅ {config_name}: 新增 {result['new_papers']} 篇论文")
-            else:
-                print(f"❌ {config_name}: 失败 - {result.get('error', '未知错误')}")
+        # 完成后统一汇总，避免并发更新共享计数器
+        successful_configs = sum(1 for r in all_results if r["success"])
+        total_new_papers = sum(r["new_papers"] for r in all_results if r["success"])
 
         print(f"\n📊 批量处理完成!")
         print(f"✅ 成功: {successful_configs} 个")
@@ -293,21 +395,15 @@ def send_batch_summary_notification(results: List[Dict[str, Any]]) -> bool:
             print("⚠️ 飞书模块不可用，跳过通知")
             return False
 
-        # 直接加载默认配置用于通知
-        import yaml
-
-        with open("conf/default.yaml", "r", encoding="utf-8") as f:
-            default_cfg_dict = yaml.safe_load(f)
-        default_cfg = OmegaConf.create(default_cfg_dict)
-
-        from feishu_chat_notification import create_chat_notifier_from_config
+        # 直接加载默认配置用于通知（带缓存）
+        default_cfg = load_config_file(f"{_CONF_DIR}/default.yaml")
 
         notifier = create_chat_notifier_from_config(default_cfg)
 
         # 构建汇总数据
         update_stats = {}
         papers_by_field = {}
-        table_links = {}
+        table_names_by_field = {}
 
         for result in results:
             if result["success"] and result["new_papers"] > 0:
@@ -336,15 +432,20 @@ def send_batch_summary_notification(results: List[Dict[str, Any]]) -> bool:
                         }
                     ]
 
-                # 生成表格链接
-                table_link = notifier.generate_table_link(table_name=result["table_name"])
-                if table_link:
-                    table_links[field_name] = table_link
+                table_names_by_field[field_name] = result["table_name"]
 
         if not update_stats:
             print("ℹ️ 没有需要通知的更新")
             return True
 
+        # 批量生成表格链接：一次请求解析所有表名，而非逐个查询
+        links_by_name = notifier.generate_table_links(list(table_names_by_field.values()))
+        table_links = {
+            field_name: links_by_name[table_name]
+            for field_name, table_name in table_names_by_field.items()
+            if table_name in links_by_name
+        }
+
         # 发送通知
         success = notifier.notify_paper_updates(
             update_stats=update_stats, papers_by_field=papers_by_field, table_links=table_links
@@ -365,6 +466,54 @@ def send_batch_summary_notification(results: List[Dict[str, Any]]) -> bool:
         return False
 
 
+# 飞书记录中可直接取值的字段映射（记录字段名 -> 论文键/属性名），模块级预编译
+_DICT_RECORD_FIELDS = (
+    ("ArXiv ID", "arxiv_id"),
+    ("标题", "title"),
+    ("作者", "authors_str"),
+    ("分类", "categories_str"),
+    ("PDF链接", "pdf_url"),
+    ("论文链接", "paper_url"),
+)
+
+_OBJ_RECORD_FIELDS = (
+    ("标题", "title"),
+    ("PDF链接", "pdf_url"),
+    ("论文链接", "entry_id"),
+)
+
+
+def _dict_paper_record(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """将字典格式的论文转换为飞书记录字段（每个键只取一次）"""
+    record = {field: paper.get(key, "") for field, key in _DICT_RECORD_FIELDS}
+
+    record["摘要"] = (paper.get("summary") or "")[:1000]
+
+    published = paper.get("published_date")
+    updated = paper.get("updated_date")
+    # isoformat()[:10] 等价于 strftime("%Y-%m-%d")，但省去格式串解析
+    record["发布日期"] = published.isoformat()[:10] if published else ""
+    record["更新日期"] = updated.isoformat()[:10] if updated else ""
+    return record
+
+
+def _obj_paper_record(paper) -> Dict[str, Any]:
+    """将对象格式的论文转换为飞书记录字段（每个属性只取一次）"""
+    record = {field: getattr(paper, attr, "") for field, attr in _OBJ_RECORD_FIELDS}
+
+    record["ArXiv ID"] = getattr(paper, "id", None) or getattr(paper, "arxiv_id", "")
+    record["作者"] = ", ".join(getattr(paper, "authors", ()))
+    record["分类"] = ", ".join(getattr(paper, "categories", ()))
+
+    record["摘要"] = (getattr(paper, "summary", None) or "")[:1000]
+
+    published = getattr(paper, "published", None)
+    updated = getattr(paper, "updated", None)
+    record["发布日期"] = published.isoformat()[:10] if published else ""
+    record["更新日期"] = updated.isoformat()[:10] if updated else ""
+    return record
+
+
 def sync_to_feishu(papers, cfg: DictConfig):
     """同步论文到飞书多维表格"""
     if not FEISHU_AVAILABLE:
@@ -377,25 +526,19 @@ def sync_to_feishu(papers, cfg: DictConfig):
         return False
 
     try:
-        from dotenv import load_dotenv
-
         load_dotenv()
 
-        # 检查环境变量
+        # 检查环境变量（取一次 os.environ，每个变量只查询一次）
         required_vars = ["FEISHU_APP_ID", "FEISHU_APP_SECRET", "FEISHU_BITABLE_APP_TOKEN", "FEISHU_PAPERS_TABLE_ID"]
 
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        env = os.environ
+        missing_vars = [var for var in required_vars if not env.get(var)]
 
         # 检查访问令牌
-        has_user_token = bool(os.getenv("FEISHU_USER_ACCESS_TOKEN")) and "xxxx" not in os.getenv(
-            "FEISHU_USER_ACCESS_TOKEN", ""
-        )
-        has_tenant_token = bool(os.getenv("FEISHU_TENANT_ACCESS_TOKEN")) and "xxxx" not in os.getenv(
-            "FEISHU_TENANT_ACCESS_TOKEN", ""
-        )
+        user_token = env.get("FEISHU_USER_ACCESS_TOKEN", "")
+        tenant_token = env.get("FEISHU_TENANT_ACCESS_TOKEN", "")
+        has_user_token = bool(user_token) and "xxxx" not in user_token
+        has_tenant_token = bool(tenant_token) and "xxxx" not in tenant_token
 
         if missing_vars or (not has_user_token and not has_tenant_token):
             print("❌ 飞书配置不完整，请先运行 setup_feishu.py 配置")
@@ -404,54 +547,18 @@ def sync_to_feishu(papers, cfg: DictConfig):
         print("\n🔗 开始同步到飞书多维表格...")
         connector = FeishuBitableConnector()
 
-        # 准备论文数据
-        feishu_papers = []
-        for paper in papers:
-            # 处理不同的论文对象格式
-            if isinstance(paper, dict):
-                # 字典格式的论文对象
-                paper_data = {
-                    "ArXiv ID": paper.get("arxiv_id", ""),
-                    "标题": paper.get("title", ""),
-                    "作者": paper.get("authors_str", ""),
-                    "摘要": (paper.get("summary", "")[:1000] if paper.get("summary") else ""),
-                    "分类": paper.get("categories_str", ""),
-                    "发布日期": paper.get("published_date").strftime("%Y-%m-%d") if paper.get("published_date") else "",
-                    "更新日期": paper.get("updated_date").strftime("%Y-%m-%d") if paper.get("updated_date") else "",
-                    "PDF链接": paper.get("pdf_url", ""),
-                    "论文链接": paper.get("paper_url", ""),
-                }
-            else:
-                # 对象格式的论文对象
-                paper_data = {
-                    "ArXiv ID": getattr(paper, "id", getattr(paper, "arxiv_id", "")),
-                    "标题": getattr(paper, "title", ""),
-                    "作者": ", ".join(getattr(paper, "authors", [])),
-                    "摘要": (getattr(paper, "summary", "")[:1000] if getattr(paper, "summary") else ""),
-                    "分类": ", ".join(getattr(paper, "categories", [])),
-                    "发布日期": (
-                        getattr(paper, "published", None).strftime("%Y-%m-%d")
-                        if getattr(paper, "published", None)
-                        else ""
-                    ),
-                    "更新日期": (
-                        getattr(paper, "updated", None).strftime("%Y-%m-%d") if getattr(paper, "updated", None) else ""
-                    ),
-                    "PDF链接": getattr(paper, "pdf_url", ""),
-                    "论文链接": getattr(paper, "entry_id", ""),
-                }
-            feishu_papers.append(paper_data)
-
-        # 批量同步到飞书
+        # 批量同步到飞书（批次上限对齐Bitable批量接口的单次限制）
         sync_threshold = feishu_cfg.get("sync_threshold", 0.0)
-        batch_size = feishu_cfg.get("batch_size", 20)
+        batch_size = feishu_cfg.get("batch_size", 500)
+
+        # 先过滤低分论文（如果有评分），再按类型分流转换——
+        # 落选论文完全不做字段转换；getattr一次取值替代 hasattr+二次访问
+        eligible = [p for p in papers if (score := getattr(p, "score", None)) is None or score >= sync_threshold]
+        dict_papers = [p for p in eligible if isinstance(p, dict)]
+        obj_papers = [p for p in eligible if not isinstance(p, dict)]
 
-        # 过滤低分论文（如果有评分）
-        papers_to_sync = []
-        for i, paper_data in enumerate(feishu_papers):
-            if hasattr(papers[i], "score") and papers[i].score < sync_threshold:
-                continue
-            papers_to_sync.append(paper_data)
+        papers_to_sync = [_dict_paper_record(p) for p in dict_papers]
+        papers_to_sync.extend(_obj_paper_record(p) for p in obj_papers)
 
         if not papers_to_sync:
             print("ℹ️ 没有符合同步条件的论文")
@@ -459,22 +566,27 @@ def sync_to_feishu(papers, cfg: DictConfig):
 
         print(f"📊 准备同步 {len(papers_to_sync)} 篇论文到飞书...")
 
-        # 分批同步
+        # 分批同步：多批时用线程池重叠请求，下一批在上一批解析响应时已在途
+        batches = [papers_to_sync[i : i + batch_size] for i in range(0, len(papers_to_sync), batch_size)]
         synced_count = 0
-        for i in range(0, len(papers_to_sync), batch_size):
-            batch = papers_to_sync[i : i + batch_size]
-
-            try:
-                result = connector.batch_insert_paper_records(batch)
-                if result and result.get("records"):
-                    batch_synced = len(result.get("records", []))
-                    synced_count += batch_synced
-                    print(f"✅ 第 {i//batch_size + 1} 批同步成功: {batch_synced} 篇")
-                else:
-                    print(f"⚠️ 第 {i//batch_size + 1} 批同步可能失败")
-            except Exception as e:
-                print(f"❌ 第 {i//batch_size + 1} 批同步失败: {e}")
-                continue
+
+        def _insert_batch(batch):
+            return connector.batch_insert_paper_records(batch)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+            future_map = {executor.submit(_insert_batch, batch): i for i, batch in enumerate(batches)}
+            for future in as_completed(future_map):
+                batch_num = future_map[future] + 1
+                try:
+                    result = future.result()
+                    if result and result.get("records"):
+                        batch_synced = len(result.get("records", []))
+                        synced_count += batch_synced
+                        print(f"✅ 第 {batch_num} 批同步成功: {batch_synced} 篇")
+                    else:
+                        print(f"⚠️ 第 {batch_num} 批同步可能失败")
+                except Exception as e:
+                    print(f"❌ 第 {batch_num} 批同步失败: {e}")
 
         print(f"🎉 飞书同步完成！成功同步 {synced_count} 篇论文")
 
@@ -485,7 +597,7 @@ def sync_to_feishu(papers, cfg: DictConfig):
             if relations_table_id:
                 try:
                     relation_data = {
-                        "论文ID": "batch_" + datetime.now().strftime("%Y%m%d_%H%M%S"),
+                        "论文ID": f"batch_{datetime.now():%Y%m%d_%H%M%S}",
                         "领域ID": research_area,
                         "领域名称": cfg.get("user_profile", {}).get("name", research_area),
                         "相关性评分": 1.0,
@@ -504,13 +616,14 @@ def sync_to_feishu(papers, cfg: DictConfig):
         return False
 
 
-def load_keywords_from_config(cfg: DictConfig):
-    """从配置中加载关键词"""
+def load_keywords_from_config(cfg):
+    """从配置中加载关键词（兼容DictConfig和普通dict）"""
     # 新的扩展配置结构 - 优先使用关键词配置中的设置
-    if hasattr(cfg, "keywords"):
+    keywords_cfg = cfg.get("keywords", None)
+    if keywords_cfg is not None:
         # 传统结构支持
-        raw_interest_keywords = cfg.keywords.get("interest_keywords", [])
-        raw_exclude_keywords = cfg.keywords.get("exclude_keywords", [])
+        raw_interest_keywords = keywords_cfg.get("interest_keywords", [])
+        raw_exclude_keywords = keywords_cfg.get("exclude_keywords", [])
     else:
         # 直接从根级别获取
         raw_interest_keywords = cfg.get("interest_keywords", [])
@@ -532,11 +645,9 @@ def load_keywords_from_config(cfg: DictConfig):
     return interest_keywords, exclude_keywords, raw_interest_keywords, required_keywords_config
 
 
-def _filter_keywords(keywords):
-    """过滤关键词列表，移除注释行和空行"""
-    if not keywords:
-        return []
-
+@functools.lru_cache(maxsize=256)
+def _filter_keywords_cached(keywords: tuple) -> tuple:
+    """按原始关键词元组缓存过滤结果，同一配置多次加载时只扫描一次"""
     filtered = []
     for keyword in keywords:
         # 跳过空字符串
@@ -547,35 +658,65 @@ def _filter_keywords(keywords):
         if keyword.strip().startswith("#"):
             continue
 
-        # 保留有效关键词
-        filtered.append(keyword.strip())
+        # 保留有效关键词；intern 后跨配置共享同一字符串对象，加速后续哈希比较
+        filtered.append(sys.intern(keyword.strip()))
+
+    return tuple(filtered)
 
-    return filtered
+
+def _filter_keywords(keywords):
+    """过滤关键词列表，移除注释行和空行"""
+    if not keywords:
+        return []
+
+    return list(_filter_keywords_cached(tuple(keywords)))
+
+
+def _deep_merge(base: dict, override: dict) -> dict:
+    """递归合并普通dict，override优先；原地写入base并返回"""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+# 关键词配置中 *_config 后缀的节会覆盖对应的全局配置节
+_CONFIG_MAPPINGS = {
+    "search_config": "search",
+    "intelligent_matching_config": "intelligent_matching",
+    "download_config": "download",
+    "display_config": "display",
+    "output_config": "output",
+}
 
 
 def merge_configs(global_cfg: DictConfig, keyword_cfg: DictConfig) -> DictConfig:
-    """合并全局配置和关键词配置，关键词配置优先"""
-    merged_cfg = OmegaConf.merge(global_cfg, keyword_cfg)
-
-    # 如果关键词配置有search_config，则覆盖全局search配置
-    if hasattr(keyword_cfg, "search_config"):
-        merged_cfg.search = OmegaConf.merge(merged_cfg.search, keyword_cfg.search_config)
-
-    # 如果关键词配置有其他_config后缀的配置，则覆盖对应的全局配置
-    config_mappings = {
-        "intelligent_matching_config": "intelligent_matching",
-        "download_config": "download",
-        "display_config": "display",
-        "output_config": "output",
-    }
+    """合并全局配置和关键词配置，关键词配置优先
+
+    两棵配置树各转换为普通dict一次，之后全部走纯Python递归合并，
+    避免多次 OmegaConf.merge 的树遍历和校验开销。
+
+    注意必须 resolve=False：${oc.env:FEISHU_*} 这类插值要保持惰性，
+    等到 sync 路径 load_dotenv 之后再求值；插值字符串在普通dict合并中
+    原样保留，最后 OmegaConf.create 重新包装后恢复惰性解析。
+    """
+    merged = _deep_merge(
+        OmegaConf.to_container(global_cfg, resolve=False),
+        OmegaConf.to_container(keyword_cfg, resolve=False),
+    )
 
-    for config_key, global_key in config_mappings.items():
-        if hasattr(keyword_cfg, config_key):
-            if not hasattr(merged_cfg, global_key):
-                merged_cfg[global_key] = {}
-            merged_cfg[global_key] = OmegaConf.merge(merged_cfg[global_key], keyword_cfg[config_key])
+    for config_key, global_key in _CONFIG_MAPPINGS.items():
+        override_section = merged.get(config_key)
+        if isinstance(override_section, dict):
+            target = merged.get(global_key)
+            if isinstance(target, dict):
+                _deep_merge(target, override_section)
+            else:
+                merged[global_key] = override_section
 
-    return merged_cfg
+    return OmegaConf.create(merged)
 
 
 def print_config_info(cfg: DictConfig):
@@ -649,57 +790,79 @@ def print_config_info(cfg: DictConfig):
     print("=" * 70)
 
 
+def _resolve_report_meta(final_cfg) -> tuple:
+    """解析报告元信息：配置文件名与研究领域名
+
+    两个保存分支各自重复了 HydraConfig 查询和 user_profile/defaults
+    级联判断，这里统一计算一次，调用方直接复用结果。
+    """
+    # initialized() 是 O(1) 的线程局部检查，比裸 except 更便宜也不会吞掉其他异常
+    actual_config_name = HydraConfig.get().job.config_name if HydraConfig.initialized() else "unknown"
+
+    # OmegaConf.select 沿路径走一次就带默认值返回；原来的 hasattr 级联
+    # 会让每个节点先为 hasattr 解析一遍、再为真正取值解析一遍
+    research_area = (
+        OmegaConf.select(final_cfg, "user_profile.research_area", default=None)
+        or OmegaConf.select(final_cfg, "defaults[0].keywords", default="")
+        or ""
+    )
+
+    return actual_config_name, research_area
+
+
+def _save_report(displayer, papers, field_name, days, include_scores, config_name, research_area, output_format):
+    """按输出格式保存论文报告
+
+    两个分支的保存逻辑完全一致，只是 include_scores 取值不同，
+    统一收拢到这里按 format 分派。
+    """
+    save_fn = displayer.save_papers_report_markdown if output_format == "markdown" else displayer.save_papers_report
+    save_fn(
+        papers,
+        field_name,
+        days,
+        include_scores=include_scores,
+        config_name=config_name,
+        research_area=research_area,
+    )
+
+
 @hydra.main(version_base=None, config_path="conf", config_name="default")
 def main(cfg: DictConfig) -> None:
     """主函数"""
 
     # 检查是否是批量处理模式
-    try:
-        hydra_cfg = HydraConfig.get()
-        config_name = hydra_cfg.job.config_name
-
-        if config_name == "all":
-            # 批量处理所有sync配置
-            success = process_all_configs()
-            if success:
-                print(f"\n✅ 批量同步完成！")
-            else:
-                print(f"\n❌ 批量同步失败！")
-            return
-    except:
-        pass  # 如果无法获取配置名，继续正常处理
+    if HydraConfig.initialized() and HydraConfig.get().job.config_name == "all":
+        # 批量处理所有sync配置
+        success = process_all_configs()
+        if success:
+            print(f"\n✅ 批量同步完成！")
+        else:
+            print(f"\n❌ 批量同步失败！")
+        return
 
     # 检查是否是扩展配置结构，如果是则进行配置合并
     if hasattr(cfg, "search_config") or hasattr(cfg, "user_profile"):
-        # 创建基础配置结构
-        base_cfg = OmegaConf.create(
-            {
-                "search": {"days": 7, "max_results": 300, "max_display": 10, "min_score": 0.1, "field": "all"},
-                "download": {
-                    "enabled": False,
-                    "max_downloads": 10,
-                    "download_dir": "downloads",
-                    "create_metadata": True,
-                    "create_index": True,
-                    "force_download": False,
-                },
-                "intelligent_matching": {
-                    "enabled": False,
-                    "score_weights": {"base": 1.0, "semantic": 0.3, "author": 0.2, "novelty": 0.4, "citation": 0.3},
-                    "fuzzy_threshold": 0.8,
-                    "time_decay_days": 30,
-                },
-                "display": {"show_ranking": True, "show_scores": True, "show_breakdown": False, "stats": True},
-                "output": {"save": True, "save_keywords": False, "include_scores": True, "format": "markdown"},
-            }
-        )
-        final_cfg = merge_configs(base_cfg, cfg)
+        final_cfg = merge_configs(_BASE_CFG, cfg)
     else:
         # 传统配置结构，直接使用
         final_cfg = cfg
 
+    # 一次性解析为普通字典快照：后续所有配置访问都是 C 层的 dict 取值，
+    # ${...} 插值也只在这里求值一次；final_cfg 仅保留给需要
+    # DictConfig 语义的下游（print_config_info / sync / 报告元信息）
+    cfg_d = OmegaConf.to_container(final_cfg, resolve=True)
+
+    # 常用配置节与参数一次取出为局部变量，后续两个分支直接复用
+    search_cfg = cfg_d.get("search") or {}
+    download_cfg = cfg_d.get("download") or {}
+    display_cfg = cfg_d.get("display") or {}
+    output_cfg = cfg_d.get("output") or {}
+    days = search_cfg.get("days", 7)
+    max_display = search_cfg.get("max_display", 10)
+
     # 初始化组件
-    download_dir = final_cfg.get("download", {}).get("download_dir", "downloads")
+    download_dir = download_cfg.get("download_dir", "downloads")
     arxiv_api = ArxivAPI(download_dir=download_dir)
     paper_ranker = PaperRanker()
     displayer = PaperDisplayer()
@@ -707,14 +870,12 @@ def main(cfg: DictConfig) -> None:
     # 打印配置信息
     print_config_info(final_cfg)
 
-    # 加载关键词
+    # 加载关键词（传入字典快照，内部访问无需再走 OmegaConf）
     interest_keywords, exclude_keywords, raw_interest_keywords, required_keywords_config = load_keywords_from_config(
-        final_cfg
+        cfg_d
     )
 
     # 获取论文 - 支持日期范围搜索
-    search_cfg = final_cfg.get("search", {})
-
     # 检查是否启用日期范围搜索
     date_range_cfg = search_cfg.get("date_range", {})
     batch_processing_cfg = search_cfg.get("batch_processing", {})
@@ -739,7 +900,7 @@ def main(cfg: DictConfig) -> None:
     else:
         # 使用传统的天数搜索，也支持分批处理
         papers = arxiv_api.get_recent_papers(
-            days=search_cfg.get("days", 7),
+            days=days,
             max_results=search_cfg.get("max_results", 300),
             field_type=search_cfg.get("field", "all"),
             batch_config=batch_processing_cfg,
@@ -760,14 +921,13 @@ def main(cfg: DictConfig) -> None:
         field_name = "全部"
 
     # 显示统计信息
-    display_cfg = final_cfg.get("display", {})
     if display_cfg.get("stats", True):
         displayer.display_hot_categories(papers)
 
     # 智能排序处理
     if interest_keywords or exclude_keywords:
         # 检查是否启用智能匹配
-        intelligent_cfg = final_cfg.get("intelligent_matching", {})
+        intelligent_cfg = cfg_d.get("intelligent_matching") or {}
         use_intelligent = intelligent_cfg.get("enabled", False)
         score_weights = None
 
@@ -795,143 +955,106 @@ def main(cfg: DictConfig) -> None:
             else:
                 displayer.display_ranking_stats(score_stats, excluded_papers)
 
-        if ranked_papers:
+        if not ranked_papers:
+            # 空结果先行短路：定时批量运行里不少领域会一篇都搜不到，
+            # 不再进入下载/同步/展示/保存的任何判断
+            print("❌ 没有找到符合条件的相关论文")
+        else:
             # PDF下载处理
-            download_cfg = final_cfg.get("download", {})
-            if download_cfg.get("enabled", False) and ranked_papers:
+            if download_cfg.get("enabled", False):
                 print(f"\n📥 开始下载PDF文件...")
                 download_stats = arxiv_api.batch_download_pdfs(
-                    ranked_papers[: download_cfg.get("max_downloads", 10)],
+                    ranked_papers,
                     max_downloads=download_cfg.get("max_downloads", 10),
                     create_index=download_cfg.get("create_index", True),
                 )
 
-                print(
-                    f"📊 下载统计: 成功 {download_stats['downloaded']}, "
-                    f"跳过 {download_stats['skipped']}, 失败 {download_stats['failed']}"
+                log.info(
+                    "📊 下载统计: 成功 %d, 跳过 %d, 失败 %d",
+                    download_stats["downloaded"],
+                    download_stats["skipped"],
+                    download_stats["failed"],
                 )
 
                 if download_stats["failed_papers"]:
-                    print("❌ 下载失败的论文:")
+                    log.info("❌ 下载失败的论文:")
                     for failed in download_stats["failed_papers"]:
-                        print(f"   - {failed['title'][:50]}... ({failed['error']})")
+                        log.info("   - %s... (%s)", failed["title"][:50], failed["error"])
 
             # 同步到飞书多维表格
             if FEISHU_AVAILABLE:
                 sync_papers_to_feishu(ranked_papers, final_cfg)
 
-            display_cfg = final_cfg.get("display", {})
             if display_cfg.get("show_ranking", True):
                 if use_intelligent:
                     show_breakdown = display_cfg.get("show_breakdown", False)
-                    displayer.display_advanced_ranked_papers(
-                        ranked_papers, search_cfg.get("max_display", 10), show_breakdown=show_breakdown
-                    )
+                    displayer.display_advanced_ranked_papers(ranked_papers, max_display, show_breakdown=show_breakdown)
                 else:
                     displayer.display_ranked_papers(
                         ranked_papers,
-                        search_cfg.get("max_display", 10),
+                        max_display,
                         show_scores=display_cfg.get("show_scores", True),
                     )
 
             # 保存报告
-            output_cfg = final_cfg.get("output", {})
             if output_cfg.get("save", True):
-                # 获取配置文件名和研究领域名
-                try:
-                    hydra_cfg = HydraConfig.get()
-                    actual_config_name = hydra_cfg.job.config_name
-                except:
-                    actual_config_name = "unknown"
-
-                # 获取研究领域名或用户名
-                research_area = ""
-                if hasattr(final_cfg, "user_profile"):
-                    research_area = final_cfg.user_profile.get("research_area", "")
-                elif hasattr(final_cfg, "defaults"):
-                    research_area = final_cfg.defaults[0].keywords if hasattr(final_cfg.defaults[0], "keywords") else ""
-
-                output_format = output_cfg.get("format", "txt")
-
-                if output_format == "markdown":
-                    displayer.save_papers_report_markdown(
-                        ranked_papers,
-                        field_name,
-                        search_cfg.get("days", 7),
-                        include_scores=output_cfg.get("include_scores", True),
-                        config_name=actual_config_name,
-                        research_area=research_area,
-                    )
-                else:
-                    displayer.save_papers_report(
-                        ranked_papers,
+                actual_config_name, research_area = _resolve_report_meta(final_cfg)
+                _save_report(
+                    displayer,
+                    ranked_papers,
+                    field_name,
+                    days,
+                    include_scores=output_cfg.get("include_scores", True),
+                    config_name=actual_config_name,
+                    research_area=research_area,
+                    output_format=output_cfg.get("format", "txt"),
+                )
+    else:
+        # 展示、飞书同步、报告保存互相独立（stdout / 网络 / 本地磁盘），
+        # 线程池并发提交，把飞书的网络延迟藏在本地渲染和写盘后面
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            sink_futures = [executor.submit(displayer.display_papers_detailed, papers, max_display)]
+
+            # 同步到飞书多维表格（无关键词筛选）
+            if FEISHU_AVAILABLE:
+                sink_futures.append(executor.submit(sync_papers_to_feishu, papers, final_cfg))
+
+            if output_cfg.get("save", True):
+                actual_config_name, research_area = _resolve_report_meta(final_cfg)
+                # 无关键词筛选时论文没有评分，include_scores 固定关闭
+                sink_futures.append(
+                    executor.submit(
+                        _save_report,
+                        displayer,
+                        papers,
                         field_name,
-                        search_cfg.get("days", 7),
-                        include_scores=output_cfg.get("include_scores", True),
+                        days,
+                        include_scores=False,
                         config_name=actual_config_name,
                         research_area=research_area,
+                        output_format=output_cfg.get("format", "txt"),
                     )
-        else:
-            print("❌ 没有找到符合条件的相关论文")
-    else:
-        # 常规显示
-        displayer.display_papers_detailed(papers, search_cfg.get("max_display", 10))
+                )
 
-        # 同步到飞书多维表格（无关键词筛选）
-        if FEISHU_AVAILABLE:
-            sync_papers_to_feishu(papers, final_cfg)
+            for future in sink_futures:
+                future.result()
 
-        # PDF下载处理（无关键词筛选）
-        download_cfg = final_cfg.get("download", {})
-        if download_cfg.get("enabled", False) and papers:
+        # PDF下载处理（无关键词筛选，papers 非空已在前面保证）
+        if download_cfg.get("enabled", False):
             print(f"\n📥 开始下载PDF文件...")
             download_stats = arxiv_api.batch_download_pdfs(
-                papers[: download_cfg.get("max_downloads", 10)],
+                papers,
                 max_downloads=download_cfg.get("max_downloads", 10),
                 create_index=download_cfg.get("create_index", True),
             )
 
-            print(
-                f"📊 下载统计: 成功 {download_stats['downloaded']}, "
-                f"跳过 {download_stats['skipped']}, 失败 {download_stats['failed']}"
+            log.info(
+                "📊 下载统计: 成功 %d, 跳过 %d, 失败 %d",
+                download_stats["downloaded"],
+                download_stats["skipped"],
+                download_stats["failed"],
             )
 
-        if final_cfg.output.save:
-            # 获取配置文件名和研究领域名
-            try:
-                hydra_cfg = HydraConfig.get()
-                actual_config_name = hydra_cfg.job.config_name
-            except:
-                actual_config_name = "unknown"
-
-            # 获取研究领域名或用户名
-            research_area = ""
-            if hasattr(final_cfg, "user_profile"):
-                research_area = final_cfg.user_profile.get("research_area", "")
-            elif hasattr(final_cfg, "defaults"):
-                research_area = final_cfg.defaults[0].keywords if hasattr(final_cfg.defaults[0], "keywords") else ""
-
-            output_format = final_cfg.output.get("format", "txt")
-
-            if output_format == "markdown":
-                displayer.save_papers_report_markdown(
-                    papers,
-                    field_name,
-                    final_cfg.search.days,
-                    include_scores=False,
-                    config_name=actual_config_name,
-                    research_area=research_area,
-                )
-            else:
-                displayer.save_papers_report(
-                    papers,
-                    field_name,
-                    final_cfg.search.days,
-                    include_scores=False,
-                    config_name=actual_config_name,
-                    research_area=research_area,
-                )
-
     print(f"\n✅ 采集完成！")
 
 
@@ -12,6 +12,15 @@ import requests
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+# 优先使用 orjson 加速JSON编解码（批量同步的请求体可达数百条记录），
+# 不可用时回退到标准库 json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class FeishuBitableConfig:
@@ -183,11 +192,15 @@ class FeishuBitableConnector:
         """发送API请求"""
         url = f"{self.config.base_url}/{endpoint}"
 
+        # orjson 可用时自行序列化请求体（会话头里已有 Content-Type: application/json）
+        if ORJSON_AVAILABLE and "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+
         for attempt in range(self.config.max_retries):
             try:
                 response = self.session.request(method, url, timeout=self.config.timeout, **kwargs)
 
-                result = response.json()
+                result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
 
                 if result.get('code') == 0:
                     return result.get('data', {})
@@ -205,7 +218,10 @@ class FeishuBitableConnector:
                         f"API请求失败: {result.get('msg', 'Unknown error')}", result.get('code'), result
                     )
 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError 覆盖响应体不是合法JSON的情况（空响应、网关HTML等）：
+                # requests 的 JSONDecodeError 和 orjson.JSONDecodeError 都是其子类，
+                # 两条解析路径的重试和 FeishuBitableAPIError 包装行为保持一致
                 if attempt == self.config.max_retries - 1:
                     raise FeishuBitableAPIError(f"网络请求失败: {str(e)}")
                 time.sleep(self.config.retry_delay)
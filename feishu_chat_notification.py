@@ -37,6 +37,8 @@ class FeishuChatNotifier:
         self.session.headers.update(
             {'Content-Type': 'application/json; charset=utf-8', 'Authorization': f'Bearer {config.access_token}'}
         )
+        # 表名 -> 链接 缓存，同一 notifier 重复查询时无需再访问API
+        self._table_link_cache: Dict[str, str] = {}
 
         print(f"🤖 飞书群聊通知器已初始化，token类型: {config.token_type}")
 
@@ -408,6 +410,43 @@ class FeishuChatNotifier:
             print(f"⚠️ 生成表格链接失败: {e}")
             return None
 
+    def generate_table_links(self, table_names: List[str]) -> Dict[str, str]:
+        """批量生成多维表格访问链接
+
+        generate_table_link 每次都会新建连接器并拉取整个表格列表，
+        循环调用时 N 个表名就是 N 次串行请求。这里一次 list_tables
+        解析全部表名，并将结果缓存在实例上供重复查询复用。
+
+        Args:
+            table_names: 表格名称列表
+
+        Returns:
+            {表格名称: 访问链接}，未找到的表名不会出现在结果中
+        """
+        pending = [name for name in table_names if name and name not in self._table_link_cache]
+
+        if pending:
+            try:
+                app_token = self.config.app_token
+                if not app_token:
+                    print("⚠️ 未配置多维表格app_token，无法生成表格链接")
+                else:
+                    from feishu_bitable_connector import FeishuBitableConnector
+
+                    connector = FeishuBitableConnector(self.config)
+                    name_to_id = {table.get('name'): table.get('table_id') for table in connector.list_tables()}
+
+                    for name in pending:
+                        table_id = name_to_id.get(name)
+                        if table_id:
+                            self._table_link_cache[name] = f"https://feishu.cn/base/{app_token}?table={table_id}&view=vew"
+                        else:
+                            print(f"⚠️ 未找到表格: {name}")
+            except Exception as e:
+                print(f"⚠️ 批量生成表格链接失败: {e}")
+
+        return {name: link for name in table_names if (link := self._table_link_cache.get(name))}
+
     def test_notification(self, test_stats: Dict[str, Any] = None) -> bool:
         """测试通知功能
 
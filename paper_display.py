@@ -5,10 +5,24 @@
 """
 
 from datetime import datetime
+from string import Template
 from typing import List, Dict, Any
 import os
+import sys
 from pathlib import Path
 
+# 每篇论文的 Markdown 基础信息块：模块级构建一次，循环内只做字段替换；
+# 评分/链接/评分详情等可选行仍按条件单独追加
+_PAPER_MD_BASE = Template(
+    "### $idx. $title\n\n"
+    "| 项目 | 信息 |\n"
+    "|------|------|\n"
+    "| **ArXiv ID** | $arxiv_id |\n"
+    "| **作者** | $authors |\n"
+    "| **分类** | $categories |\n"
+    "| **发布日期** | $published |\n"
+)
+
 
 class PaperDisplayer:
     """论文显示类"""
@@ -58,31 +72,37 @@ class PaperDisplayer:
             print("📝 没有找到相关论文")
             return
 
-        print(f"\n📋 智能排序论文 (显示前{min(max_display, len(papers))}篇):")
-        print("=" * 90)
+        # 逐条 print 每行都是一次 stdout 写入；先拼好再一次性输出
+        lines = [f"\n📋 智能排序论文 (显示前{min(max_display, len(papers))}篇):\n", "=" * 90 + "\n"]
 
         for i, paper in enumerate(papers[:max_display], 1):
             score = paper.get('relevance_score', 0)
             matched_interests = paper.get('matched_interests', [])
 
-            print(f"\n{i:2d}. {paper['title']}")
+            lines.append(f"\n{i:2d}. {paper['title']}\n")
             if show_scores:
-                print(f"    🎯 相关性评分: {score:.2f}")
+                lines.append(f"    🎯 相关性评分: {score:.2f}\n")
                 if matched_interests:
-                    print(f"    🔍 匹配关键词: {', '.join(matched_interests)}")
-
-            print(f"    👥 作者: {paper['authors_str']}")
-            print(f"    🏷️  分类: {paper['categories_str']}")
-            print(f"    📅 发布: {paper['published_date'].strftime('%Y-%m-%d %H:%M')}")
-            print(f"    🔗 论文: {paper['paper_url']}")
-            print(f"    📄 PDF: {paper['pdf_url']}")
+                    lines.append(f"    🔍 匹配关键词: {', '.join(matched_interests)}\n")
 
             # 显示摘要（限制长度）
             summary = paper['summary']
             if len(summary) > 200:
                 summary = summary[:200] + '...'
-            print(f"    📝 摘要: {summary}")
-            print("    " + "-" * 86)
+
+            published = paper.get('published_str') or paper['published_date'].strftime('%Y-%m-%d %H:%M')
+            lines.append(
+                f"    👥 作者: {paper['authors_str']}\n"
+                f"    🏷️  分类: {paper['categories_str']}\n"
+                f"    📅 发布: {published}\n"
+                f"    🔗 论文: {paper['paper_url']}\n"
+                f"    📄 PDF: {paper['pdf_url']}\n"
+                f"    📝 摘要: {summary}\n"
+            )
+            lines.append("    " + "-" * 86 + "\n")
+
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
 
     def display_papers_detailed(self, papers: List[Dict[str, Any]], max_display: int = 10):
         """详细显示论文信息"""
@@ -90,23 +110,29 @@ class PaperDisplayer:
             print("📝 没有找到相关论文")
             return
 
-        print(f"\n📋 论文详情 (显示前{min(max_display, len(papers))}篇):")
-        print("=" * 80)
+        # 同 display_ranked_papers：整段拼好后一次写出
+        lines = [f"\n📋 论文详情 (显示前{min(max_display, len(papers))}篇):\n", "=" * 80 + "\n"]
 
         for i, paper in enumerate(papers[:max_display], 1):
-            print(f"\n{i:2d}. {paper['title']}")
-            print(f"    👥 作者: {paper['authors_str']}")
-            print(f"    🏷️  分类: {paper['categories_str']}")
-            print(f"    📅 发布: {paper['published_date'].strftime('%Y-%m-%d %H:%M')}")
-            print(f"    🔗 论文: {paper['paper_url']}")
-            print(f"    📄 PDF: {paper['pdf_url']}")
-
             # 显示摘要（限制长度）
             summary = paper['summary']
             if len(summary) > 200:
                 summary = summary[:200] + '...'
-            print(f"    📝 摘要: {summary}")
-            print("    " + "-" * 76)
+
+            published = paper.get('published_str') or paper['published_date'].strftime('%Y-%m-%d %H:%M')
+            lines.append(
+                f"\n{i:2d}. {paper['title']}\n"
+                f"    👥 作者: {paper['authors_str']}\n"
+                f"    🏷️  分类: {paper['categories_str']}\n"
+                f"    📅 发布: {published}\n"
+                f"    🔗 论文: {paper['paper_url']}\n"
+                f"    📄 PDF: {paper['pdf_url']}\n"
+                f"    📝 摘要: {summary}\n"
+            )
+            lines.append("    " + "-" * 76 + "\n")
+
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
 
     def display_ranking_stats(self, score_stats: Dict[str, Any], excluded_papers: List[Dict[str, Any]]):
         """显示排序统计信息"""
@@ -199,33 +225,46 @@ class PaperDisplayer:
         filename = f"{self.output_dir}/{'_'.join(name_parts)}.txt"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"arXiv 论文收集报告\n")
-                f.write(f"生成时间: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n")
-                f.write(f"配置文件: {config_name}\n")
-                f.write(f"研究领域: {research_area}\n")
-                f.write(f"查询字段: {field_name}\n")
-                f.write(f"时间范围: 最近 {days} 天\n")
-                f.write(f"总论文数: {len(papers)}\n")
-                if include_scores:
-                    f.write(f"智能排序: 已启用\n")
-                f.write("=" * 80 + "\n\n")
-
-                for i, paper in enumerate(papers, 1):
-                    f.write(f"{i}. {paper['title']}\n")
-
-                    if include_scores and 'relevance_score' in paper:
-                        f.write(f"   相关性评分: {paper['relevance_score']:.2f}\n")
-                        if paper.get('matched_interests'):
-                            f.write(f"   匹配关键词: {', '.join(paper['matched_interests'])}\n")
-
-                    f.write(f"   作者: {paper['authors_str']}\n")
-                    f.write(f"   分类: {paper['categories_str']}\n")
-                    f.write(f"   发布: {paper['published_date'].strftime('%Y-%m-%d %H:%M')}\n")
-                    f.write(f"   链接: {paper['paper_url']}\n")
-                    f.write(f"   PDF: {paper['pdf_url']}\n")
-                    f.write(f"   摘要: {paper['summary']}\n")
-                    f.write("-" * 80 + "\n\n")
+            # 先在内存里拼好整份报告，最后一次写入，
+            # 避免逐行 f.write 在大报告上反复触发小块系统调用
+            parts = [
+                "arXiv 论文收集报告\n",
+                f"生成时间: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n",
+                f"配置文件: {config_name}\n",
+                f"研究领域: {research_area}\n",
+                f"查询字段: {field_name}\n",
+                f"时间范围: 最近 {days} 天\n",
+                f"总论文数: {len(papers)}\n",
+            ]
+            if include_scores:
+                parts.append("智能排序: 已启用\n")
+            parts.append("=" * 80 + "\n\n")
+
+            # 评分列是否渲染在循环外决定一次：排序产出的论文列表是同构的，
+            # 不必每篇都重复做字段检查
+            render_scores = include_scores and 'relevance_score' in papers[0]
+
+            for i, paper in enumerate(papers, 1):
+                parts.append(f"{i}. {paper['title']}\n")
+
+                if render_scores:
+                    parts.append(f"   相关性评分: {paper.get('relevance_score', 0):.2f}\n")
+                    if paper.get('matched_interests'):
+                        parts.append(f"   匹配关键词: {', '.join(paper['matched_interests'])}\n")
+
+                published = paper.get('published_str') or paper['published_date'].strftime('%Y-%m-%d %H:%M')
+                parts.append(
+                    f"   作者: {paper['authors_str']}\n"
+                    f"   分类: {paper['categories_str']}\n"
+                    f"   发布: {published}\n"
+                    f"   链接: {paper['paper_url']}\n"
+                    f"   PDF: {paper['pdf_url']}\n"
+                    f"   摘要: {paper['summary']}\n"
+                )
+                parts.append("-" * 80 + "\n\n")
+
+            with open(filename, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                f.write(''.join(parts))
 
             print(f"💾 报告已保存到: {filename}")
             return filename
@@ -298,85 +337,93 @@ class PaperDisplayer:
         filepath = output_path / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # 写入标题和基本信息
-                f.write(f"# ArXiv 论文采集报告\n\n")
-                f.write(f"- **生成时间**: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n")
-                f.write(f"- **配置文件**: {config_name}\n")
-                if research_area and research_area != config_name:
-                    f.write(f"- **研究领域**: {research_area}\n")
-                f.write(f"- **搜索领域**: {field_name}\n")
-                f.write(f"- **时间范围**: 最近{days}天\n")
-                f.write(f"- **论文数量**: {len(papers)}篇\n")
-                f.write(f"\n---\n\n")
-
-                # 统计信息
+            # 与 txt 报告相同：整份内容先拼接，最后一次写入
+            parts = [
+                "# ArXiv 论文采集报告\n\n",
+                f"- **生成时间**: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}\n",
+                f"- **配置文件**: {config_name}\n",
+            ]
+            if research_area and research_area != config_name:
+                parts.append(f"- **研究领域**: {research_area}\n")
+            parts.append(f"- **搜索领域**: {field_name}\n")
+            parts.append(f"- **时间范围**: 最近{days}天\n")
+            parts.append(f"- **论文数量**: {len(papers)}篇\n")
+            parts.append("\n---\n\n")
+
+            # 统计信息
+            if include_scores:
+                scores = [p.get('final_score', p.get('relevance_score', 0)) for p in papers]
+                if scores:
+                    parts.append("## 📊 统计信息\n\n")
+                    parts.append(f"- **最高评分**: {max(scores):.2f}\n")
+                    parts.append(f"- **最低评分**: {min(scores):.2f}\n")
+                    parts.append(f"- **平均评分**: {sum(scores)/len(scores):.2f}\n\n")
+
+            # 论文列表
+            parts.append("## 📚 论文列表\n\n")
+
+            for i, paper in enumerate(papers, 1):
+                # 标题和基本信息
+                title = paper.get('title', 'Unknown Title')
+                authors = paper.get('authors_str', 'Unknown Authors')
+                arxiv_id = paper.get('arxiv_id', 'N/A')
+                categories = paper.get('categories_str', 'N/A')
+                published = paper.get('published_date', 'N/A')
+
+                # 标题 + 基本信息表格
+                parts.append(
+                    _PAPER_MD_BASE.substitute(
+                        idx=i,
+                        title=title,
+                        arxiv_id=arxiv_id,
+                        authors=authors,
+                        categories=categories,
+                        published=published,
+                    )
+                )
+
+                # 评分信息
                 if include_scores:
-                    scores = [p.get('final_score', p.get('relevance_score', 0)) for p in papers]
-                    if scores:
-                        f.write(f"## 📊 统计信息\n\n")
-                        f.write(f"- **最高评分**: {max(scores):.2f}\n")
-                        f.write(f"- **最低评分**: {min(scores):.2f}\n")
-                        f.write(f"- **平均评分**: {sum(scores)/len(scores):.2f}\n\n")
-
-                # 论文列表
-                f.write(f"## 📚 论文列表\n\n")
-
-                for i, paper in enumerate(papers, 1):
-                    # 标题和基本信息
-                    title = paper.get('title', 'Unknown Title')
-                    authors = paper.get('authors_str', 'Unknown Authors')
-                    arxiv_id = paper.get('arxiv_id', 'N/A')
-                    categories = paper.get('categories_str', 'N/A')
-                    published = paper.get('published_date', 'N/A')
-
-                    f.write(f"### {i}. {title}\n\n")
-
-                    # 基本信息表格
-                    f.write(f"| 项目 | 信息 |\n")
-                    f.write(f"|------|------|\n")
-                    f.write(f"| **ArXiv ID** | {arxiv_id} |\n")
-                    f.write(f"| **作者** | {authors} |\n")
-                    f.write(f"| **分类** | {categories} |\n")
-                    f.write(f"| **发布日期** | {published} |\n")
-
-                    # 评分信息
-                    if include_scores:
-                        score = paper.get('final_score', paper.get('relevance_score', 0))
-                        f.write(f"| **相关性评分** | {score:.2f} |\n")
-
-                        if 'matched_interests' in paper:
-                            matched = ', '.join(paper['matched_interests'])
-                            f.write(f"| **匹配关键词** | {matched} |\n")
-
-                    # 链接
-                    paper_url = paper.get('paper_url', '')
-                    pdf_url = paper.get('pdf_url', '')
-                    if paper_url:
-                        f.write(f"| **论文链接** | [{arxiv_id}]({paper_url}) |\n")
-                    if pdf_url:
-                        f.write(f"| **PDF下载** | [PDF]({pdf_url}) |\n")
-
-                    f.write(f"\n")
-
-                    # 摘要
-                    summary = paper.get('summary', 'No summary available')
-                    f.write(f"**摘要**: {summary}\n\n")
-
-                    # 评分详情（如果启用了高级评分）
-                    if include_scores and 'score_breakdown' in paper:
-                        breakdown = paper['score_breakdown']
-                        f.write(f"**评分详情**:\n")
-                        f.write(f"- 基础匹配: {breakdown.get('base_score', 0):.2f}\n")
-                        f.write(f"- 语义增强: {breakdown.get('semantic_boost', 0):.2f}\n")
-                        f.write(f"- 作者分析: {breakdown.get('author_boost', 0):.2f}\n")
-                        f.write(f"- 新颖性: {breakdown.get('novelty_boost', 0):.2f}\n")
-                        f.write(f"- 引用潜力: {breakdown.get('citation_potential', 0):.2f}\n\n")
-
-                    f.write(f"---\n\n")
-
-                # 页脚
-                f.write(f"\n*报告由 ArXiv 论文采集工具生成*\n")
+                    score = paper.get('final_score', paper.get('relevance_score', 0))
+                    parts.append(f"| **相关性评分** | {score:.2f} |\n")
+
+                    if 'matched_interests' in paper:
+                        matched = ', '.join(paper['matched_interests'])
+                        parts.append(f"| **匹配关键词** | {matched} |\n")
+
+                # 链接
+                paper_url = paper.get('paper_url', '')
+                pdf_url = paper.get('pdf_url', '')
+                if paper_url:
+                    parts.append(f"| **论文链接** | [{arxiv_id}]({paper_url}) |\n")
+                if pdf_url:
+                    parts.append(f"| **PDF下载** | [PDF]({pdf_url}) |\n")
+
+                parts.append("\n")
+
+                # 摘要
+                summary = paper.get('summary', 'No summary available')
+                parts.append(f"**摘要**: {summary}\n\n")
+
+                # 评分详情（如果启用了高级评分）
+                if include_scores and 'score_breakdown' in paper:
+                    breakdown = paper['score_breakdown']
+                    parts.append(
+                        f"**评分详情**:\n"
+                        f"- 基础匹配: {breakdown.get('base_score', 0):.2f}\n"
+                        f"- 语义增强: {breakdown.get('semantic_boost', 0):.2f}\n"
+                        f"- 作者分析: {breakdown.get('author_boost', 0):.2f}\n"
+                        f"- 新颖性: {breakdown.get('novelty_boost', 0):.2f}\n"
+                        f"- 引用潜力: {breakdown.get('citation_potential', 0):.2f}\n\n"
+                    )
+
+                parts.append("---\n\n")
+
+            # 页脚
+            parts.append("\n*报告由 ArXiv 论文采集工具生成*\n")
+
+            with open(filepath, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                f.write(''.join(parts))
 
             print(f"💾 Markdown报告已保存到: {filepath}")
 
@@ -462,7 +509,8 @@ class PaperDisplayer:
 
             print(f"    👥 作者: {paper['authors_str']}")
             print(f"    🏷️  分类: {paper['categories_str']}")
-            print(f"    📅 发布: {paper['published_date'].strftime('%Y-%m-%d %H:%M')}")
+            published = paper.get('published_str') or paper['published_date'].strftime('%Y-%m-%d %H:%M')
+            print(f"    📅 发布: {published}")
             print(f"    🔗 论文: {paper['paper_url']}")
             print(f"    📄 PDF: {paper['pdf_url']}")
 
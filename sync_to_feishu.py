@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 from feishu_bitable_connector import FeishuBitableConnector
+from feishu_chat_notification import create_chat_notifier_from_config
 
 
 def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None):
@@ -32,21 +33,17 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
         print("ℹ️ 飞书同步已禁用")
         return False
 
-    # 检查环境变量
+    # 检查环境变量（取一次 os.environ，每个变量只查询一次）
     required_vars = ['FEISHU_APP_ID', 'FEISHU_APP_SECRET', 'FEISHU_BITABLE_APP_TOKEN']
 
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    env = os.environ
+    missing_vars = [var for var in required_vars if not env.get(var)]
 
     # 检查访问令牌
-    has_user_token = bool(os.getenv('FEISHU_USER_ACCESS_TOKEN')) and 'xxxx' not in os.getenv(
-        'FEISHU_USER_ACCESS_TOKEN', ''
-    )
-    has_tenant_token = bool(os.getenv('FEISHU_TENANT_ACCESS_TOKEN')) and 'xxxx' not in os.getenv(
-        'FEISHU_TENANT_ACCESS_TOKEN', ''
-    )
+    user_token = env.get('FEISHU_USER_ACCESS_TOKEN', '')
+    tenant_token = env.get('FEISHU_TENANT_ACCESS_TOKEN', '')
+    has_user_token = bool(user_token) and 'xxxx' not in user_token
+    has_tenant_token = bool(tenant_token) and 'xxxx' not in tenant_token
 
     if missing_vars or (not has_user_token and not has_tenant_token):
         print("❌ 飞书配置不完整，请先运行 setup_feishu.py 配置")
@@ -253,7 +250,7 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
                 "ArXiv ID": {"text": arxiv_id, "link": paper_url} if paper_url else arxiv_id,  # 超链接格式
                 "标题": title,
                 "作者": authors_list,  # 多选项字段
-                "摘要": summary[:1000] if summary else "",  # 限制长度
+                "摘要": (summary or "")[:1000],  # 限制长度
                 "分类": categories_list,  # 多选项字段
                 "匹配关键词": matched_keywords_list,  # 多选项字段
                 "相关性评分": round(relevance_score, 2),
@@ -284,8 +281,8 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
             print(f"ℹ️ 没有符合同步条件的论文（阈值: {sync_threshold}）")
             return 0
 
-        # 批量同步
-        batch_size = feishu_cfg.get('batch_size', 20)
+        # 批量同步：batch_create 单次上限1000条，批次越大HTTP往返越少
+        batch_size = feishu_cfg.get('batch_size', 500)
         print(f"📊 准备同步 {len(papers_to_sync)} 篇新论文到 '{table_display_name}'...")
 
         synced_count = 0
@@ -341,9 +338,6 @@ def sync_papers_to_feishu(papers, cfg, matched_keywords_map=None, score_map=None
                     if chat_config.get('enabled', False):
                         print("📢 准备发送群聊通知...")
 
-                        # 导入群聊通知模块
-                        from feishu_chat_notification import create_chat_notifier_from_config
-
                         # 创建通知器
                         notifier = create_chat_notifier_from_config(cfg)
 